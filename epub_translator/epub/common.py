@@ -1,43 +1,58 @@
 from pathlib import Path
+from weakref import WeakKeyDictionary
 from xml.etree import ElementTree as ET
 from xml.etree.ElementTree import Element
 
 from .zip import Zip
 
+# 同一个 Zip 在读 spine、metadata、toc 时会反复定位 OPF，
+# 按 Zip 实例缓存结果，container.xml 只解析一次
+_opf_path_cache: WeakKeyDictionary[Zip, Path] = WeakKeyDictionary()
+
 
 def find_opf_path(zip: Zip) -> Path:
-    container_path = Path("META-INF", "container.xml")
+    cached_path = _opf_path_cache.get(zip)
+    if cached_path is not None:
+        return cached_path
+
+    opf_path = _parse_opf_path(zip)
+    _opf_path_cache[zip] = opf_path
+    return opf_path
 
-    with zip.read(container_path) as f:
-        content = f.read()
-        root = ET.fromstring(content)
-        ns = {"ns": "urn:oasis:names:tc:opendocument:xmlns:container"}
-        rootfile = root.find(".//ns:rootfile", ns)
 
-        if rootfile is None:
-            rootfile = root.find(".//rootfile")
+_ROOTFILE_TAGS = (
+    "{urn:oasis:names:tc:opendocument:xmlns:container}rootfile",
+    "rootfile",
+)
 
-        if rootfile is None:
-            raise ValueError("Cannot find rootfile in container.xml")
 
-        full_path = rootfile.get("full-path")
-        if full_path is None:
-            raise ValueError("rootfile element has no full-path attribute")
+def _parse_opf_path(zip: Zip) -> Path:
+    container_path = Path("META-INF", "container.xml")
+
+    with zip.read(container_path) as f:
+        # iterparse 流式解析，碰到第一个 rootfile 就返回，不为剩余内容建树
+        for _, elem in ET.iterparse(f, events=("end",)):
+            if elem.tag in _ROOTFILE_TAGS:
+                full_path = elem.get("full-path")
+                if full_path is None:
+                    raise ValueError("rootfile element has no full-path attribute")
+                return Path(full_path)
 
-        return Path(full_path)
+    raise ValueError("Cannot find rootfile in container.xml")
 
 
 def strip_namespace(elem: Element) -> None:
-    if elem.tag.startswith("{"):
-        elem.tag = elem.tag.split("}", 1)[1]
-
-    for child in elem:
-        strip_namespace(child)
+    # iter() 在 C 层遍历整棵子树，省掉逐子元素的 Python 递归帧；
+    # partition 单次 C 调用取尾部，不像 split 那样额外分配列表
+    for child in elem.iter():
+        tag = child.tag
+        if tag.startswith("{"):
+            child.tag = tag.partition("}")[2]
 
 
 def extract_namespace(tag: str) -> str | None:
     if tag.startswith("{"):
-        parts = tag.split("}", 1)
-        if len(parts) == 2:
-            return parts[0][1:]
+        namespace_uri, separator, _ = tag[1:].partition("}")
+        if separator:
+            return namespace_uri
     return None
@@ -48,8 +48,9 @@ def read_metadata(zip: Zip) -> tuple[list[MetadataField], MetadataContext]:
     fields: list[MetadataField] = []
     for elem in metadata_elem:
         tag_name = elem.tag
-        if elem.text and elem.text.strip() and tag_name not in SKIP_FIELDS:
-            fields.append(MetadataField(tag_name=tag_name, text=elem.text.strip()))
+        text = elem.text
+        if text and not text.isspace() and tag_name not in SKIP_FIELDS:
+            fields.append(MetadataField(tag_name=tag_name, text=text.strip()))
 
     context = MetadataContext(opf_path=opf_path, xml_node=xml_node)
     return fields, context
@@ -75,7 +76,7 @@ def write_metadata(zip: Zip, fields: list[MetadataField], context: MetadataConte
 
     for elem in metadata_elem:
         tag_name = elem.tag
-        if tag_name in fields_by_tag and elem.text and elem.text.strip():
+        if tag_name in fields_by_tag and elem.text and not elem.text.isspace():
             counter = tag_counters[tag_name]
             if counter < len(fields_by_tag[tag_name]):
                 elem.text = fields_by_tag[tag_name][counter]
@@ -12,8 +12,7 @@ def search_spine_paths(zip: Zip) -> Generator[tuple[Path, str], None, None]:
     opf_dir = opf_path.parent
 
     with zip.read(opf_path) as f:
-        content = f.read()
-        root = ET.fromstring(content)
+        root = ET.parse(f).getroot()
         strip_namespace(root)
 
         manifest = root.find(".//manifest")
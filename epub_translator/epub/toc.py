@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from xml.etree import ElementTree as ET
 from xml.etree.ElementTree import Element
@@ -8,7 +9,7 @@ from .common import find_opf_path, strip_namespace
 from .zip import Zip
 
 
-@dataclass
+@dataclass(slots=True)
 class Toc:
     """
     EPUB 2.0 对应关系:
@@ -49,8 +50,13 @@ class TocContext:
 
 
 def read_toc(zip: Zip) -> tuple[list[Toc], TocContext]:
-    version = _detect_epub_version(zip)
-    toc_path = _find_toc_path(zip, version)
+    # OPF 只解析一次，版本检测与 TOC 定位共用同一棵树
+    opf_path = find_opf_path(zip)
+    with zip.read(opf_path) as f:
+        opf_root = ET.parse(f).getroot()
+
+    version = _detect_epub_version(opf_root)
+    toc_path = _find_toc_path(opf_root, opf_path.parent, version)
 
     if toc_path is None:
         raise ValueError("Cannot find TOC file in EPUB")
@@ -77,50 +83,40 @@ def write_toc(zip: Zip, toc: list[Toc], context: TocContext) -> None:
         context.xml_node.save(f)
 
 
-def _detect_epub_version(zip: Zip) -> int:
-    opf_path = find_opf_path(zip)
-    with zip.read(opf_path) as f:
-        content = f.read()
-        root = ET.fromstring(content)
-        version_str = root.get("version", "2.0")
-
-        if version_str.startswith("3"):
-            return 3
-        else:
-            return 2
+def _detect_epub_version(opf_root: Element) -> int:
+    version_str = opf_root.get("version", "2.0")
 
+    if version_str.startswith("3"):
+        return 3
+    else:
+        return 2
 
-def _find_toc_path(zip: Zip, version: int) -> Path | None:
-    opf_path = find_opf_path(zip)
-    opf_dir = opf_path.parent
 
-    with zip.read(opf_path) as f:
-        content = f.read()
-        root = ET.fromstring(content)
-        strip_namespace(root)
+def _find_toc_path(opf_root: Element, opf_dir: Path, version: int) -> Path | None:
+    strip_namespace(opf_root)
 
-        manifest = root.find(".//manifest")
-        if manifest is None:
-            return None
+    manifest = opf_root.find(".//manifest")
+    if manifest is None:
+        return None
 
-        if version == 2:
-            # EPUB 2: 查找 NCX 文件 (media-type="application/x-dtbncx+xml")
-            for item in manifest.findall("item"):
-                media_type = item.get("media-type")
-                if media_type == "application/x-dtbncx+xml":
-                    href = item.get("href")
-                    if href:
-                        return opf_dir / href
-        else:
-            # EPUB 3: 查找 nav 文件 (properties="nav")
-            for item in manifest.findall("item"):
-                properties = item.get("properties", "")
-                if "nav" in properties.split():
-                    href = item.get("href")
-                    if href:
-                        return opf_dir / href
+    if version == 2:
+        # EPUB 2: 查找 NCX 文件 (media-type="application/x-dtbncx+xml")
+        for item in manifest.findall("item"):
+            media_type = item.get("media-type")
+            if media_type == "application/x-dtbncx+xml":
+                href = item.get("href")
+                if href:
+                    return opf_dir / href
+    else:
+        # EPUB 3: 查找 nav 文件 (properties="nav")
+        for item in manifest.findall("item"):
+            properties = item.get("properties", "")
+            if "nav" in properties.split():
+                href = item.get("href")
+                if href:
+                    return opf_dir / href
 
-        return None
+    return None
 
 
 def _read_ncx_toc(root: Element) -> list[Toc]:
@@ -128,13 +124,8 @@ def _read_ncx_toc(root: Element) -> list[Toc]:
     if nav_map is None:
         return []
 
-    result = []
-    for nav_point in nav_map.findall("navPoint"):
-        toc_item = _parse_nav_point(nav_point)
-        if toc_item:
-            result.append(toc_item)
-
-    return result
+    # 列表推导一次建好，避免逐项 append 触发的反复扩容
+    return [toc_item for nav_point in nav_map.findall("navPoint") if (toc_item := _parse_nav_point(nav_point))]
 
 
 def _parse_nav_point(nav_point: Element) -> Toc | None:
@@ -160,11 +151,9 @@ def _parse_nav_point(nav_point: Element) -> Toc | None:
         if src:
             href, fragment = _split_href(src)
 
-    children = []
-    for child_nav_point in nav_point.findall("navPoint"):
-        child_toc = _parse_nav_point(child_nav_point)
-        if child_toc:
-            children.append(child_toc)
+    children = [
+        child_toc for child_nav_point in nav_point.findall("navPoint") if (child_toc := _parse_nav_point(child_nav_point))
+    ]
 
     return Toc(
         title=title,
@@ -175,6 +164,12 @@ def _parse_nav_point(nav_point: Element) -> Toc | None:
     )
 
 
+# 写目录时同一批固定标签名会在每个节点上重建一次，缓存后退化为一次查表
+@lru_cache(maxsize=None)
+def _ns_tag(ns: str | None, name: str) -> str:
+    return f"{{{ns}}}{name}" if ns else name
+
+
 def _update_ncx_toc(root: Element, toc_list: list[Toc]) -> None:
     nav_map = root.find(".//navMap")
     if nav_map is None:
@@ -183,8 +178,7 @@ def _update_ncx_toc(root: Element, toc_list: list[Toc]) -> None:
 
 
 def _update_nav_points(parent: Element, toc_list: list[Toc], ns: str | None, start_play_order: int = 1) -> int:
-    tag_prefix = f"{{{ns}}}" if ns else ""
-    nav_point_tag = f"{tag_prefix}navPoint"
+    nav_point_tag = _ns_tag(ns, "navPoint")
     existing_nav_points = [elem for elem in parent if elem.tag == nav_point_tag]
     matched_pairs = _match_toc_with_elements(toc_list, existing_nav_points)
     for nav_point in existing_nav_points:
@@ -206,19 +200,18 @@ def _update_nav_points(parent: Element, toc_list: list[Toc], ns: str | None, sta
 
 
 def _update_nav_point_content(nav_point: Element, toc: Toc, ns: str | None, play_order: int) -> None:
-    tag_prefix = f"{{{ns}}}" if ns else ""
     if toc.id:
         nav_point.set("id", toc.id)
 
     nav_point.set("playOrder", str(play_order))
 
-    nav_label = nav_point.find(f"{tag_prefix}navLabel")
+    nav_label = nav_point.find(_ns_tag(ns, "navLabel"))
     if nav_label is not None:
-        text_elem = nav_label.find(f"{tag_prefix}text")
+        text_elem = nav_label.find(_ns_tag(ns, "text"))
         if text_elem is not None:
             text_elem.text = toc.title
 
-    content_elem = nav_point.find(f"{tag_prefix}content")
+    content_elem = nav_point.find(_ns_tag(ns, "content"))
     if content_elem is not None and toc.href is not None:
         full_href = toc.full_href
         if full_href:
@@ -226,23 +219,21 @@ def _update_nav_point_content(nav_point: Element, toc: Toc, ns: str | None, play
 
 
 def _create_nav_point(toc: Toc, ns: str | None, play_order: int) -> Element:
-    tag_prefix = f"{{{ns}}}" if ns else ""
-
-    nav_point = Element(f"{tag_prefix}navPoint")
+    nav_point = Element(_ns_tag(ns, "navPoint"))
     if toc.id:
         nav_point.set("id", toc.id)
     else:
         nav_point.set("id", f"navPoint-{play_order}")
     nav_point.set("playOrder", str(play_order))
 
-    nav_label = Element(f"{tag_prefix}navLabel")
-    text_elem = Element(f"{tag_prefix}text")
+    nav_label = Element(_ns_tag(ns, "navLabel"))
+    text_elem = Element(_ns_tag(ns, "text"))
     text_elem.text = toc.title
     nav_label.append(text_elem)
     nav_point.append(nav_label)
 
     if toc.href is not None:
-        content_elem = Element(f"{tag_prefix}content")
+        content_elem = Element(_ns_tag(ns, "content"))
         full_href = toc.full_href
         if full_href:
             content_elem.set("src", full_href)
@@ -266,13 +257,7 @@ def _read_nav_toc(root: Element) -> list[Toc]:
     if ol is None:
         return []
 
-    result = []
-    for li in ol.findall("li"):
-        toc_item = _parse_nav_li(li)
-        if toc_item:
-            result.append(toc_item)
-
-    return result
+    return [toc_item for li in ol.findall("li") if (toc_item := _parse_nav_li(li))]
 
 
 def _parse_nav_li(li: Element) -> Toc | None:
@@ -307,10 +292,7 @@ def _parse_nav_li(li: Element) -> Toc | None:
     children = []
     child_ol = li.find("ol")
     if child_ol is not None:
-        for child_li in child_ol.findall("li"):
-            child_toc = _parse_nav_li(child_li)
-            if child_toc:
-                children.append(child_toc)
+        children = [child_toc for child_li in child_ol.findall("li") if (child_toc := _parse_nav_li(child_li))]
 
     return Toc(
         title=title,
@@ -340,8 +322,7 @@ def _update_nav_toc(root: Element, toc_list: list[Toc]) -> None:
 
 
 def _update_nav_lis(ol: Element, toc_list: list[Toc], ns: str | None) -> None:
-    tag_prefix = f"{{{ns}}}" if ns else ""
-    li_tag = f"{tag_prefix}li"
+    li_tag = _ns_tag(ns, "li")
     existing_lis = [elem for elem in ol if elem.tag == li_tag]
     matched_pairs = _match_toc_with_elements(toc_list, existing_lis)
 
@@ -358,20 +339,19 @@ def _update_nav_lis(ol: Element, toc_list: list[Toc], ns: str | None) -> None:
         ol.append(li)
 
         if toc.children:
-            child_ol = li.find(f"{tag_prefix}ol")
+            child_ol = li.find(_ns_tag(ns, "ol"))
             if child_ol is None:
-                child_ol = Element(f"{tag_prefix}ol")
+                child_ol = Element(_ns_tag(ns, "ol"))
                 li.append(child_ol)
             _update_nav_lis(child_ol, toc.children, ns)
 
 
 def _update_nav_li_content(li: Element, toc: Toc, ns: str | None) -> None:
-    tag_prefix = f"{{{ns}}}" if ns else ""
     if toc.id:
         li.set("id", toc.id)
 
-    a = li.find(f"{tag_prefix}a")
-    span = li.find(f"{tag_prefix}span")
+    a = li.find(_ns_tag(ns, "a"))
+    span = li.find(_ns_tag(ns, "span"))
 
     if toc.href is not None:
         if a is not None:
@@ -381,7 +361,7 @@ def _update_nav_li_content(li: Element, toc: Toc, ns: str | None) -> None:
                 a.set("href", full_href)
         elif span is not None:
             li.remove(span)
-            a = Element(f"{tag_prefix}a")
+            a = Element(_ns_tag(ns, "a"))
             a.text = toc.title
             full_href = toc.full_href
             if full_href:
@@ -392,27 +372,26 @@ def _update_nav_li_content(li: Element, toc: Toc, ns: str | None) -> None:
             span.text = toc.title
         elif a is not None:
             li.remove(a)
-            span = Element(f"{tag_prefix}span")
+            span = Element(_ns_tag(ns, "span"))
             span.text = toc.title
             li.insert(0, span)
 
 
 def _create_nav_li(toc: Toc, ns: str | None) -> Element:
-    tag_prefix = f"{{{ns}}}" if ns else ""
-    li = Element(f"{tag_prefix}li")
+    li = Element(_ns_tag(ns, "li"))
 
     if toc.id:
         li.set("id", toc.id)
 
     if toc.href is not None:
-        a = Element(f"{tag_prefix}a")
+        a = Element(_ns_tag(ns, "a"))
         a.text = toc.title
         full_href = toc.full_href
         if full_href:
             a.set("href", full_href)
         li.append(a)
     else:
-        span = Element(f"{tag_prefix}span")
+        span = Element(_ns_tag(ns, "span"))
         span.text = toc.title
         li.append(span)
 
@@ -436,32 +415,43 @@ def _match_toc_with_elements(toc_list: list[Toc], elements: list[Element]) -> li
     2. 通过 href 匹配
     3. 通过位置匹配
     """
+    # 先按 id 和 href 建索引，匹配从逐项线性扫描降为 O(1) 查表
+    id_to_indexes: dict[str, list[int]] = {}
+    href_to_indexes: dict[str, list[int]] = {}
+    for i, elem in enumerate(elements):
+        elem_id = elem.get("id")
+        if elem_id is not None:
+            id_to_indexes.setdefault(elem_id, []).append(i)
+        elem_href = _extract_href_from_element(elem)
+        if elem_href:
+            href_to_indexes.setdefault(elem_href, []).append(i)
+
     result = []
     used_elements = set()
 
+    def take_unused(indexes: list[int] | None) -> int | None:
+        if indexes:
+            for index in indexes:
+                if index not in used_elements:
+                    return index
+        return None
+
     for toc in toc_list:
         matched = None
         if toc.id:
-            for i, elem in enumerate(elements):
-                if i in used_elements:
-                    continue
-                elem_id = elem.get("id")
-                if elem_id == toc.id:
-                    matched = elem
-                    used_elements.add(i)
-                    break
+            index = take_unused(id_to_indexes.get(toc.id))
+            if index is not None:
+                matched = elements[index]
+                used_elements.add(index)
         result.append((toc, matched))
 
     for i, (toc, matched) in enumerate(result):
         if matched is None and toc.href:
-            for j, elem in enumerate(elements):
-                if j in used_elements:
-                    continue
-                elem_href = _extract_href_from_element(elem)
-                if elem_href and elem_href == toc.full_href:
-                    result[i] = (toc, elem)
-                    used_elements.add(j)
-                    break
+            full_href = toc.full_href
+            index = take_unused(href_to_indexes.get(full_href) if full_href else None)
+            if index is not None:
+                result[i] = (toc, elements[index])
+                used_elements.add(index)
 
     unmatched_indices = [i for i, (_, matched) in enumerate(result) if matched is None]
     available_elements = [elem for j, elem in enumerate(elements) if j not in used_elements]
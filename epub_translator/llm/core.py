@@ -1,4 +1,5 @@
 import datetime
+import string
 import threading
 from collections.abc import Generator
 from importlib.resources import files
@@ -16,6 +17,9 @@ from .increasable import Increasable
 from .statistics import Statistics
 from .types import Message
 
+# 只折叠 ASCII 大写，保证长度不变，折叠后的下标可直接映射回原文
+_ASCII_LOWER_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
 # Global state for logger filename generation
 _LOGGER_LOCK = threading.Lock()
 _LAST_TIMESTAMP: str | None = None
@@ -158,42 +162,21 @@ class LLM:
         return logger
 
     def _search_quotes(self, kind: str, response: str) -> Generator[str, None, None]:
-        start_marker = f"```{kind}"
+        start_marker = f"```{kind}".translate(_ASCII_LOWER_TABLE)
         end_marker = "```"
+        # 整段折叠一次大小写，之后全部用 C 层 str.find 定位，不再逐字符比较
+        folded_response = response.translate(_ASCII_LOWER_TABLE)
         start_index = 0
 
         while True:
-            start_index = self._find_ignore_case(
-                raw=response,
-                sub=start_marker,
-                start=start_index,
-            )
+            start_index = folded_response.find(start_marker, start_index)
             if start_index == -1:
                 break
 
-            end_index = self._find_ignore_case(
-                raw=response,
-                sub=end_marker,
-                start=start_index + len(start_marker),
-            )
+            end_index = folded_response.find(end_marker, start_index + len(start_marker))
             if end_index == -1:
                 break
 
             extracted_text = response[start_index + len(start_marker) : end_index].strip()
             yield extracted_text
             start_index = end_index + len(end_marker)
-
-    def _find_ignore_case(self, raw: str, sub: str, start: int = 0):
-        if not sub:
-            return 0 if 0 >= start else -1
-
-        raw_len, sub_len = len(raw), len(sub)
-        for i in range(start, raw_len - sub_len + 1):
-            match = True
-            for j in range(sub_len):
-                if raw[i + j].lower() != sub[j].lower():
-                    match = False
-                    break
-            if match:
-                return i
-        return -1
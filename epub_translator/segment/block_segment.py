@@ -54,6 +54,10 @@ class BlockSegment:
         self._root_tag: str = root_tag
         self._inline_segments: list[InlineSegment] = inline_segments
         self._id2inline_segment: dict[int, InlineSegment] = dict((cast(int, s.id), s) for s in self._inline_segments)
+        # 模板结构不变，期望的 id -> 元素映射只算一次；每轮校验只需浅拷贝
+        self._id2expected_element: dict[int, Element] = dict(
+            (id, inline_segment.parent) for id, inline_segment in self._id2inline_segment.items()
+        )
 
     def __iter__(self) -> Generator[InlineSegment, None, None]:
         yield from self._inline_segments
@@ -72,9 +76,7 @@ class BlockSegment:
                 instead_tag=validated_element.tag,
             )
 
-        remain_expected_elements: dict[int, Element] = dict(
-            (id, inline_segment.parent) for id, inline_segment in self._id2inline_segment.items()
-        )
+        remain_expected_elements: dict[int, Element] = dict(self._id2expected_element)
         for child_validated_element in validated_element:
             element_id = validate_id_in_element(child_validated_element)
             if isinstance(element_id, FoundInvalidIDError):
@@ -116,6 +116,8 @@ class InlineSegment:
         # 注意，相同 tag 下的 element 要么全部有 id，要么全部都没有 id
         self._child_tag2ids: dict[str, list[int]] = {}
         self._child_tag2count: dict[str, int] = {}
+        # validate 每轮重试都要用到期望的 id -> 元素映射，惰性构建一次，id 重排时失效
+        self._id2expected_element: dict[int, Element] | None = None
 
         next_temp_id: int = 1
         terms = nest((child.parent.tag, child) for child in children if isinstance(child, InlineSegment))
@@ -175,6 +177,7 @@ class InlineSegment:
     def recreate_ids(self, id_generator: IDGenerator) -> None:
         self._child_tag2count.clear()
         self._child_tag2ids.clear()
+        self._id2expected_element = None
 
         for child in self._children:
             if isinstance(child, InlineSegment):
@@ -210,10 +213,11 @@ class InlineSegment:
         return element
 
     def validate(self, validated_element: Element) -> Generator[InlineError | FoundInvalidIDError, None, None]:
-        remain_expected_elements: dict[int, Element] = {}
-        for child in self._child_inline_segments():
-            if child.id is not None:
-                remain_expected_elements[child.id] = child.parent
+        if self._id2expected_element is None:
+            self._id2expected_element = {
+                child.id: child.parent for child in self._child_inline_segments() if child.id is not None
+            }
+        remain_expected_elements: dict[int, Element] = dict(self._id2expected_element)
 
         for _, child_element in iter_with_stack(validated_element):
             if child_element is validated_element:
@@ -283,7 +287,7 @@ class InlineSegment:
     # 即便 self.validate(...) 的错误没有排除干净，也要尽可能匹配一个质量较高（尽力而为）的版本
     def assign_attributes(self, template_element: Element) -> Element:
         assigned_element = Element(self.parent.tag, self.parent.attrib)
-        if template_element.text and template_element.text.strip():
+        if template_element.text and not template_element.text.isspace():
             assigned_element.text = append_text_in_element(
                 origin_text=assigned_element.text,
                 append_text=template_element.text,
@@ -308,7 +312,7 @@ class InlineSegment:
                 previous_assigned_child_element = assigned_child_element_stack.pop()
             if child_element.tail is not None:
                 child_text += child_element.tail
-            if not child_text.strip():
+            if not child_text or child_text.isspace():
                 continue
             if previous_assigned_child_element is None:
                 assigned_element.text = append_text_in_element(
@@ -17,7 +17,8 @@ class TextPosition(Enum):
     TAIL = auto()
 
 
-@dataclass
+# 一本书会产生海量 segment 实例，slots 省掉每个实例的 __dict__ 开销
+@dataclass(slots=True)
 class TextSegment:
     text: str
     parent_stack: list[Element]
@@ -131,11 +132,11 @@ def _search_text_segments(stack: list[Element], element: Element) -> Generator[T
 
 
 def find_block_depth(parent_stack: list[Element]) -> int:
-    index: int = 0
-    for i in range(len(parent_stack)):
+    # 只关心最深的块级元素，倒序扫到第一个就停，无需判定整条栈
+    for i in range(len(parent_stack) - 1, -1, -1):
         if not is_inline_element(parent_stack[i]):
-            index = i
-    return index + 1  # depth is a count not index
+            return i + 1  # depth is a count not index
+    return 1
 
 
 def combine_text_segments(segments: Iterable[TextSegment]) -> Generator[tuple[Element, dict[int, Element]], None, None]:
@@ -185,7 +186,7 @@ def combine_text_segments(segments: Iterable[TextSegment]) -> Generator[tuple[El
 def _common_depth(stack1: Iterable[Element], stack2: Iterable[Element]) -> int:
     common_depth: int = 0
     for parent1, parent2 in zip(stack1, stack2):
-        if id(parent1) != id(parent2):
+        if parent1 is not parent2:
             break
         common_depth += 1
     return common_depth
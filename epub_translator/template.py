@@ -16,6 +16,10 @@ def create_env(dir_path: Path) -> Environment:
 
 _LoaderResult = tuple[str, str | None, Callable[[], bool] | None]
 
+_RELATIVE_PATH_PATTERN = re.compile(r"^\.+/")
+_LEADING_SLASH_PATTERN = re.compile(r"^/")
+_JINJA_SUFFIX_PATTERN = re.compile(r"\.jinja$", flags=re.IGNORECASE)
+
 
 class _DSLoader(BaseLoader):
     def __init__(self, dir_path: Path):
@@ -32,11 +36,11 @@ class _DSLoader(BaseLoader):
         return self._get_source_with_path(target_path)
 
     def _norm_template(self, template: str) -> str:
-        if bool(re.match(r"^\.+/", template)):
+        if _RELATIVE_PATH_PATTERN.match(template):
             raise TemplateNotFound(f"invalid path {template}")
 
-        template = re.sub(r"^/", "", template)
-        template = re.sub(r"\.jinja$", "", template, flags=re.IGNORECASE)
+        template = _LEADING_SLASH_PATTERN.sub("", template)
+        template = _JINJA_SUFFIX_PATTERN.sub("", template)
         template = f"{template}.jinja"
 
         return template
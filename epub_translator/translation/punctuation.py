@@ -15,20 +15,17 @@ _QUOTE_MAPPING = {
     "〉": "》",
 }
 
-
-def _strip_quotes(text: str):
-    for char in text:
-        mapped = _QUOTE_MAPPING.get(char, None)
-        if mapped is None:
-            yield char
-        elif mapped:
-            yield mapped
+_QUOTE_CHARS = frozenset(_QUOTE_MAPPING)
+_QUOTE_TABLE = str.maketrans(_QUOTE_MAPPING)
 
 
 def unwrap_french_quotes(element: Element) -> Element:
     for _, child_element in iter_with_stack(element):
-        if child_element.text:
-            child_element.text = "".join(_strip_quotes(child_element.text))
-        if child_element.tail:
-            child_element.tail = "".join(_strip_quotes(child_element.tail))
+        text = child_element.text
+        # 绝大多数文本不含引号，先做 C 层的 disjoint 检查，未命中就不重建字符串
+        if text and not _QUOTE_CHARS.isdisjoint(text):
+            child_element.text = text.translate(_QUOTE_TABLE)
+        tail = child_element.tail
+        if tail and not _QUOTE_CHARS.isdisjoint(tail):
+            child_element.tail = tail.translate(_QUOTE_TABLE)
     return element
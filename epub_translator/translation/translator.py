@@ -77,7 +77,9 @@ def translate(
         # mimetype should be the first file in the EPUB ZIP
         zip.migrate(Path("mimetype"))
 
-        total_chapters = sum(1 for _, _ in search_spine_paths(zip))
+        # spine 只解析一遍 OPF，计数与后续生成任务共用同一份列表
+        spine_paths = list(search_spine_paths(zip))
+        total_chapters = len(spine_paths)
         toc_list, toc_context = read_toc(zip)
         metadata_fields, metadata_context = read_metadata(zip)
 
@@ -104,6 +106,7 @@ def translate(
             on_fill_failed=on_fill_failed,
             tasks=_generate_tasks_from_book(
                 zip=zip,
+                spine_paths=spine_paths,
                 toc_list=toc_list,
                 toc_context=toc_context,
                 metadata_fields=metadata_fields,
@@ -145,6 +148,7 @@ def translate(
 
 def _generate_tasks_from_book(
     zip: Zip,
+    spine_paths: list[tuple[Path, str]],
     toc_list: list,
     toc_context: TocContext,
     metadata_fields: list,
@@ -169,7 +173,8 @@ def _generate_tasks_from_book(
             payload=_ElementContext(element_type=_ElementType.METADATA, metadata_context=metadata_context),
         )
 
-    for chapter_path, media_type in search_spine_paths(zip):
+    # 逐章懒加载：章节 XML 在被消费时才解析，避免整本书同时驻留内存
+    for chapter_path, media_type in spine_paths:
         with zip.read(chapter_path) as chapter_file:
             xml = XMLLikeNode(
                 file=chapter_file,
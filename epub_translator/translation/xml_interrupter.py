@@ -20,6 +20,7 @@ class XMLInterrupter:
         self._last_interrupted_id: str | None = None
         self._placeholder2interrupted: dict[int, Element] = {}
         self._raw_text_segments: dict[str, list[TextSegment]] = {}
+        self._latex_cache: dict[str, str | None] = {}  # 同一公式在书中反复出现，转换结果按原文缓存
 
     def interrupt_source_text_segments(
         self, text_segments: Iterable[TextSegment]
@@ -150,12 +151,16 @@ class XMLInterrupter:
         math_element.attrib.pop(_ID_KEY, None)
         math_element.tail = None
         latex: str | None = None
-        try:
-            mathml_str = tostring(math_element, encoding="unicode")
-            soup = BeautifulSoup(mathml_str, "html.parser")
-            latex = process_mathml(soup)
-        except Exception:
-            pass
+        mathml_str = tostring(math_element, encoding="unicode")
+        if mathml_str in self._latex_cache:
+            latex = self._latex_cache[mathml_str]
+        else:
+            try:
+                soup = BeautifulSoup(mathml_str, "html.parser")
+                latex = process_mathml(soup)
+            except Exception:
+                pass
+            self._latex_cache[mathml_str] = latex
 
         if latex is None:
             latex = "".join(t.text for t in text_segments)
@@ -180,13 +185,16 @@ class XMLInterrupter:
             # Block-level math， need to be hidden
             return
 
-        raw_text_segments = self._raw_text_segments.pop(interrupted_id, None)
+        # 只读不删：双语模式会把同一段译文展开两次，pop 会让第二遍丢失公式
+        raw_text_segments = self._raw_text_segments.get(interrupted_id, None)
         if not raw_text_segments:
             yield text_segment
             return
 
+        text_basic_parent_stack = text_segment.parent_stack[:-1]
         for raw_text_segment in raw_text_segments:
-            text_basic_parent_stack = text_segment.parent_stack[:-1]
             raw_text_segment.block_parent.attrib.pop(_ID_KEY, None)
-            raw_text_segment.parent_stack = text_basic_parent_stack + raw_text_segment.parent_stack
-            yield raw_text_segment
+            # 缓存里的 segment 保持原样，改动落在克隆上，反复展开互不污染
+            expanded_text_segment = raw_text_segment.clone()
+            expanded_text_segment.parent_stack = text_basic_parent_stack + expanded_text_segment.parent_stack
+            yield expanded_text_segment
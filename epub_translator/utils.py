@@ -5,7 +5,9 @@ from typing import TypeVar
 K = TypeVar("K")
 T = TypeVar("T")
 
-_WHITESPACE_PATTERN = re.compile(r"\s+")
+# 只匹配真正需要改写的部分：连续多个空白、或单个非空格的空白字符。
+# 已规范化的文本（只含单个空格）完全不命中，sub 直接原样返回，不再重建字符串。
+_WHITESPACE_PATTERN = re.compile(r"\s{2,}|[^\S ]")
 
 
 def normalize_whitespace(text: str) -> str:
@@ -23,6 +23,10 @@ def encode_friendly(element: Element, indent: int = 2) -> str:
 
 
 def _escape_text(text: str) -> str:
+    # 绝大多数文本节点不含 "<"，此时 parse_tags 只会原样吐回整段文本，
+    # 直接返回即可，省掉每个节点一次 StringIO 分配
+    if "<" not in text:
+        return text
     buffer = StringIO()
     for cell in parse_tags(text):
         if isinstance(cell, Tag):
@@ -80,5 +84,4 @@ def _encode_element(
 
 
 def _write_indent(buffer: StringIO, indent: int, depth: int) -> None:
-    for _ in range(indent * depth):
-        buffer.write(" ")
+    buffer.write(" " * (indent * depth))
@@ -35,17 +35,41 @@ class _XMLTagsParser:
         self._tag_buffer: StringIO = StringIO()
         self._tag: Tag | None = None
         self._phase: _Phase = _Phase.OUTSIDE
+        # 逐字符拼 str 是二次方复杂度，先收集到 list，完整后一次 join
+        self._name_chars: list[str] = []
+        self._attr_name_chars: list[str] = []
+        self._attr_value_chars: list[str] = []
 
     def do(self, chars: Iterable[str]) -> Generator[str | Tag, None, None]:
-        for char in chars:
-            parsed_result = self._parse_char(char)
-            yield from self._generate_by_result(parsed_result)
+        if isinstance(chars, str):
+            # str 输入走批量路径：标签外的文本用 C 层 find 整段拷贝，不逐字符过状态机
+            yield from self._parse_str(chars)
+        else:
+            for char in chars:
+                parsed_result = self._parse_char(char)
+                yield from self._generate_by_result(parsed_result)
 
         self._outside_buffer.write(self._tag_buffer.getvalue())
         outside_text = self._outside_buffer.getvalue()
         if outside_text != "":
             yield outside_text
 
+    def _parse_str(self, text: str) -> Generator[str | Tag, None, None]:
+        index = 0
+        length = len(text)
+        while index < length:
+            if self._phase == _Phase.OUTSIDE:
+                bracket_index = text.find("<", index)
+                if bracket_index < 0:
+                    self._outside_buffer.write(text[index:])
+                    return
+                if bracket_index > index:
+                    self._outside_buffer.write(text[index:bracket_index])
+                index = bracket_index
+            parsed_result = self._parse_char(text[index])
+            yield from self._generate_by_result(parsed_result)
+            index += 1
+
     def _parse_char(self, char: str) -> _ParsedResult:
         parsed_result: _ParsedResult = _ParsedResult.Continue
 
@@ -55,6 +79,7 @@ class _XMLTagsParser:
             else:
                 self._phase = _Phase.LEFT_BRACKET
                 self._tag_buffer.write(char)
+                self._name_chars = []
                 self._tag = Tag(
                     kind=TagKind.OPENING,
                     name="",
@@ -70,26 +95,29 @@ class _XMLTagsParser:
                     self._tag.kind = TagKind.CLOSING
                     self._phase = _Phase.LEFT_SLASH
                 elif is_valid_name_char(char):
-                    self._tag.name += char
+                    self._name_chars.append(char)
                     self._phase = _Phase.TAG_NAME
                 else:
                     parsed_result = _ParsedResult.Failed
 
             elif self._phase == _Phase.LEFT_SLASH:
                 if is_valid_name_char(char):
-                    self._tag.name += char
+                    self._name_chars.append(char)
                     self._phase = _Phase.TAG_NAME
                 else:
                     parsed_result = _ParsedResult.Failed
 
             elif self._phase == _Phase.TAG_NAME:
                 if char in _SPACES:
+                    self._tag.name = "".join(self._name_chars)
                     self._phase = _Phase.TAG_GAP
                 elif is_valid_name_char(char):
-                    self._tag.name += char
+                    self._name_chars.append(char)
                 elif char == ">":
+                    self._tag.name = "".join(self._name_chars)
                     parsed_result = _ParsedResult.Success
                 elif char == "/" and self._tag.kind == TagKind.OPENING:
+                    self._tag.name = "".join(self._name_chars)
                     self._tag.kind = TagKind.SELF_CLOSING
                     self._phase = _Phase.MUST_CLOSING_SIGN
                 else:
@@ -99,7 +127,7 @@ class _XMLTagsParser:
                 if char in _SPACES:
                     pass
                 elif is_valid_name_char(char):
-                    self._tag.attributes.append((char, ""))
+                    self._attr_name_chars = [char]
                     self._phase = _Phase.ATTRIBUTE_NAME
                 elif char == ">":
                     parsed_result = _ParsedResult.Success
@@ -111,9 +139,7 @@ class _XMLTagsParser:
 
             elif self._phase == _Phase.ATTRIBUTE_NAME:
                 if is_valid_name_char(char):
-                    attr_name, attr_value = self._tag.attributes[-1]
-                    attr_name = attr_name + char
-                    self._tag.attributes[-1] = (attr_name, attr_value)
+                    self._attr_name_chars.append(char)
                 elif char == "=":
                     self._phase = _Phase.ATTRIBUTE_NAME_EQUAL
                 else:
@@ -121,16 +147,18 @@ class _XMLTagsParser:
 
             elif self._phase == _Phase.ATTRIBUTE_NAME_EQUAL:
                 if char == '"':
+                    self._attr_value_chars = []
                     self._phase = _Phase.ATTRIBUTE_VALUE
                 else:
                     parsed_result = _ParsedResult.Failed
 
             elif self._phase == _Phase.ATTRIBUTE_VALUE:
                 if is_valid_value_char(char):
-                    attr_name, attr_value = self._tag.attributes[-1]
-                    attr_value = attr_value + char
-                    self._tag.attributes[-1] = (attr_name, attr_value)
+                    self._attr_value_chars.append(char)
                 elif char == '"':
+                    self._tag.attributes.append(
+                        ("".join(self._attr_name_chars), "".join(self._attr_value_chars)),
+                    )
                     self._phase = _Phase.TAG_GAP
                 else:
                     parsed_result = _ParsedResult.Failed
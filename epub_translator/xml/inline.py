@@ -107,7 +107,11 @@ _HTML_INLINE_TAGS = frozenset(
 
 
 def is_inline_element(element: Element) -> bool:
-    tag = element.tag.lower()
+    tag = element.tag
+    # EPUB 里的标签几乎都是小写，先按原样查一次，省掉每个元素的 lower() 分配
+    if tag in _HTML_INLINE_TAGS:
+        return True
+    tag = tag.lower()
     if tag in _HTML_INLINE_TAGS:
         return True
     display = element.get(DISPLAY_ATTRIBUTE, None)
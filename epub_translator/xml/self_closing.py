@@ -57,16 +57,19 @@ def _fix_void_element(content: str, tag_name: str) -> str:
     """
     result = []
     pos = 0
+    # 循环内会反复用到这几个标签串，提前拼好避免每轮迭代重新构造
+    opening_prefix = f"<{tag_name}"
+    closing_tag = f"</{tag_name}>"
 
     while pos < len(content):
-        tag_start = content.find(f"<{tag_name}", pos)
+        tag_start = content.find(opening_prefix, pos)
         if tag_start == -1:
             result.append(content[pos:])
             break
 
         # Verify it's a complete tag match (not a prefix like <br matching <brain>)
         # The character after tag_name must be >, /, or whitespace
-        check_pos = tag_start + len(f"<{tag_name}")
+        check_pos = tag_start + len(opening_prefix)
         if check_pos < len(content):
             next_char = content[check_pos]
             if next_char not in (">", "/", " ", "\t", "\n", "\r"):
@@ -92,22 +95,17 @@ def _fix_void_element(content: str, tag_name: str) -> str:
             pos = tag_end + 1
             continue
 
-        closing_tag = f"</{tag_name}>"
         closing_pos = content.find(closing_tag, tag_end + 1)
 
+        attrs_part = opening_tag[len(opening_prefix) : -1].rstrip()
+        if attrs_part:
+            result.append(f"{opening_prefix}{attrs_part} />")
+        else:
+            result.append(f"{opening_prefix} />")
+
         if closing_pos != -1:
-            attrs_part = opening_tag[len(f"<{tag_name}") : -1].rstrip()
-            if attrs_part:
-                result.append(f"<{tag_name}{attrs_part} />")
-            else:
-                result.append(f"<{tag_name} />")
             pos = closing_pos + len(closing_tag)
         else:
-            attrs_part = opening_tag[len(f"<{tag_name}") : -1].rstrip()
-            if attrs_part:
-                result.append(f"<{tag_name}{attrs_part} />")
-            else:
-                result.append(f"<{tag_name} />")
             pos = tag_end + 1
 
     return "".join(result)
@@ -6,12 +6,10 @@ from .const import ID_KEY
 
 
 def normalize_text_in_element(text: str | None) -> str | None:
-    if text is None:
+    # isspace 在 C 层扫描且不分配新串，先排除空白节点再做正规化
+    if text is None or not text or text.isspace():
         return None
-    text = normalize_whitespace(text)
-    if not text.strip():
-        return None
-    return text
+    return normalize_whitespace(text)
 
 
 def append_text_in_element(origin_text: str | None, append_text: str) -> str:
@@ -23,7 +21,7 @@ def append_text_in_element(origin_text: str | None, append_text: str) -> str:
 
 def index_of_parent(parent: Element, checked_element: Element) -> int:
     for i, child in enumerate(parent):
-        if child == checked_element:
+        if child is checked_element:
             return i
     raise ValueError("Element not found in parent.")
 
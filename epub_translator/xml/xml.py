@@ -3,12 +3,13 @@ from xml.etree.ElementTree import Element
 
 
 def find_first(element: Element, tag: str) -> Element | None:
-    if element.tag == tag:
-        return element
-    for child in element:
-        result = find_first(child, tag)
-        if result is not None:
-            return result
+    # 显式栈的先序遍历，避免深层文档的递归调用开销
+    stack: list[Element] = [element]
+    while stack:
+        current = stack.pop()
+        if current.tag == tag:
+            return current
+        stack.extend(reversed(current))
     return None
 
 
@@ -31,9 +32,8 @@ def iter_with_stack(element: Element) -> Generator[tuple[list[Element], Element]
             continue
 
         for child in reversed(list(current)):
-            child_path = list(current_path)
-            child_path.append(child)
-            stack.append(child_path)
+            # 单次 C 层级的拼接，比 list(...) + append 少一次 Python 调用
+            stack.append(current_path + [child])
 
 
 def clone_element(element: Element) -> Element:
@@ -47,13 +47,5 @@ def clone_element(element: Element) -> Element:
 
 
 def plain_text(element: Element) -> str:
-    return "".join(_iter_text_in(element))
-
-
-def _iter_text_in(element: Element) -> Generator[str, None, None]:
-    if element.text:
-        yield element.text
-    for child in element:
-        yield from _iter_text_in(child)
-        if child.tail:
-            yield child.tail
+    # itertext 在 C 扩展中遍历，顺序与手写递归一致（text 在前，tail 在后）
+    return "".join(element.itertext())
@@ -1,5 +1,6 @@
 import io
 import re
+import sys
 import warnings
 from html.entities import html5
 from typing import IO
@@ -31,7 +32,6 @@ _ROOT_NAMESPACES = {
 
 _ENCODING_PATTERN = re.compile(r'encoding\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
 _FIRST_ELEMENT_PATTERN = re.compile(r"<(?![?!])[a-zA-Z]")
-_NAMESPACE_IN_TAG = re.compile(r"\{([^}]+)\}")
 _HTML_NAMED_ENTITY_PATTERN = re.compile(r"&([A-Za-z][A-Za-z0-9]+);")
 _XML_PREDEFINED_ENTITIES = {"amp", "lt", "gt", "apos", "quot"}
 
@@ -145,14 +145,15 @@ class XMLLikeNode:
 
     def _extract_and_clean_namespaces(self, element: Element) -> Element:
         for _, elem in iter_with_stack(element):
-            match = _NAMESPACE_IN_TAG.match(elem.tag)
-            if match:
-                namespace_uri = match.group(1)
+            # Clark 记法固定以 { 开头，startswith + partition 纯 C 字符串操作即可拆出命名空间
+            if elem.tag.startswith("{"):
+                namespace_uri, _, local_name = elem.tag[1:].partition("}")
                 if namespace_uri not in self._namespaces:
                     prefix = _COMMON_NAMESPACES.get(namespace_uri, f"ns{len(self._namespaces)}")
                     self._namespaces[namespace_uri] = prefix
 
-                tag_name = elem.tag[len(match.group(0)) :]
+                # 拆分会生成新串，intern 后同名标签共享同一对象，后续 == 退化为指针比较
+                tag_name = sys.intern(local_name)
 
                 # Record tag -> namespace mapping (warn if conflict)
                 if tag_name in self._tag_to_namespace and self._tag_to_namespace[tag_name] != namespace_uri:
@@ -169,14 +170,13 @@ class XMLLikeNode:
                 elem.tag = tag_name
 
             for attr_key in list(elem.attrib.keys()):
-                match = _NAMESPACE_IN_TAG.match(attr_key)
-                if match:
-                    namespace_uri = match.group(1)
+                if attr_key.startswith("{"):
+                    namespace_uri, _, attr_local_name = attr_key[1:].partition("}")
                     if namespace_uri not in self._namespaces:
                         prefix = _COMMON_NAMESPACES.get(namespace_uri, f"ns{len(self._namespaces)}")
                         self._namespaces[namespace_uri] = prefix
 
-                    attr_name = attr_key[len(match.group(0)) :]
+                    attr_name = sys.intern(attr_local_name)
                     attr_value = elem.attrib.pop(attr_key)
 
                     # Record attr -> namespace mapping (warn if conflict)
@@ -208,22 +208,35 @@ class XMLLikeNode:
         # Serialize the element tree as-is (tags are simple names without prefixes)
         xml_string = tostring(element, encoding="unicode")
 
-        # Now restore namespace prefixes in the serialized string
-        # For each tag that should have a namespace prefix, wrap it with the prefix
-        for tag_name, namespace_uri in self._tag_to_namespace.items():
-            if namespace_uri not in _ROOT_NAMESPACES:
-                # Get the prefix for this namespace
-                prefix = self._namespaces[namespace_uri]
-                # Replace opening and closing tags
-                xml_string = xml_string.replace(f"<{tag_name} ", f"<{prefix}:{tag_name} ")
-                xml_string = xml_string.replace(f"<{tag_name}>", f"<{prefix}:{tag_name}>")
-                xml_string = xml_string.replace(f"</{tag_name}>", f"</{prefix}:{tag_name}>")
-                xml_string = xml_string.replace(f"<{tag_name}/>", f"<{prefix}:{tag_name}/>")
-
-        for attr_name, namespace_uri in self._attr_to_namespace.items():
-            if namespace_uri not in _ROOT_NAMESPACES:
-                prefix = self._namespaces[namespace_uri]
-                xml_string = xml_string.replace(f' {attr_name}="', f' {prefix}:{attr_name}="')
+        # Now restore namespace prefixes in the serialized string.
+        # A single compiled alternation scans the document once, instead of
+        # four str.replace passes (each O(document)) per prefixed tag name.
+        tag_prefixes = {
+            tag_name: self._namespaces[namespace_uri]
+            for tag_name, namespace_uri in self._tag_to_namespace.items()
+            if namespace_uri not in _ROOT_NAMESPACES
+        }
+        if tag_prefixes:
+            # 长名在前，避免短名抢先匹配到长名的前缀
+            names = "|".join(re.escape(name) for name in sorted(tag_prefixes, key=len, reverse=True))
+            tag_pattern = re.compile(f"(</?)({names})(?=[ >/])")
+            xml_string = tag_pattern.sub(
+                lambda m: f"{m.group(1)}{tag_prefixes[m.group(2)]}:{m.group(2)}",
+                xml_string,
+            )
+
+        attr_prefixes = {
+            attr_name: self._namespaces[namespace_uri]
+            for attr_name, namespace_uri in self._attr_to_namespace.items()
+            if namespace_uri not in _ROOT_NAMESPACES
+        }
+        if attr_prefixes:
+            names = "|".join(re.escape(name) for name in sorted(attr_prefixes, key=len, reverse=True))
+            attr_pattern = re.compile(f' ({names})="')
+            xml_string = attr_pattern.sub(
+                lambda m: f' {attr_prefixes[m.group(1)]}:{m.group(1)}="',
+                xml_string,
+            )
 
         # Apply workaround to fix standard HTML attributes (see _STANDARD_HTML_ATTRS comment)
         for pattern, replacement in _STANDARD_HTML_ATTRS:
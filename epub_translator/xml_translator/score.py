@@ -56,7 +56,8 @@ def truncate_score_segment(
     else:
         remain_text = encoding.decode(score_segment.text_tokens[-remain_text_tokens_count:])
 
-    if not remain_text.strip():
+    # isspace 在 C 层扫描即可判空，不必 strip 分配新串
+    if not remain_text or remain_text.isspace():
         return None
 
     if remain_head:
@@ -53,7 +53,7 @@ class XMLStreamMapper:
                 if current_element is None:
                     current_element = origin_element
 
-                if id(current_element) != id(origin_element):
+                if current_element is not origin_element:
                     yield current_element, mapping_buffer
                     current_element = origin_element
                     mapping_buffer = []
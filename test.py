@@ -1,16 +1,21 @@
 import sys
+from importlib.util import find_spec
 
 import pytest
 
 try:
+    args = [
+        "tests/",
+        "-v",
+        "--tb=short",
+    ]
+    # 测试文件之间相互独立（XML 解析、分词都是 CPU 密集），
+    # 装了 pytest-xdist 时按文件分发到多核并行跑，没装则照旧串行
+    if find_spec("xdist") is not None:
+        args += ["-n", "auto", "--dist", "loadfile"]
+
     # 使用 pytest 来运行测试，支持 unittest 和 pytest 风格
-    exit_code = pytest.main(
-        [
-            "tests/",
-            "-v",
-            "--tb=short",
-        ]
-    )
+    exit_code = pytest.main(args)
     sys.exit(exit_code)
 
 # pylint: disable=broad-exception-caught
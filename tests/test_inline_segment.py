@@ -1,3 +1,4 @@
+import copy
 import unittest
 from xml.etree.ElementTree import fromstring, tostring
 
@@ -17,6 +18,15 @@ def _get_first_inline_segment(segments):
     return inline_segments[0] if inline_segments else None
 
 
+# 多个测试共用的 fixture，只在模块加载时解析一次，各测试用 deepcopy 拿可变副本
+_SEPARATED_EMS_TEMPLATE = fromstring("<p>X<em>A</em>Y<em>B</em>Z</p>")
+
+
+def _separated_ems_root():
+    """返回 <p>X<em>A</em>Y<em>B</em>Z</p> 的可变副本"""
+    return copy.deepcopy(_SEPARATED_EMS_TEMPLATE)
+
+
 class TestCollectInlineSegment(unittest.TestCase):
     """测试 collect_next_inline_segment 收集内联片段功能"""
 
@@ -51,7 +61,7 @@ class TestCollectInlineSegment(unittest.TestCase):
     def test_collect_separated_same_tags(self):
         """测试收集被文本分隔的相同标签"""
         # <p>X<em>A</em>Y<em>B</em>Z</p>
-        root = fromstring("<p>X<em>A</em>Y<em>B</em>Z</p>")
+        root = _separated_ems_root()
         segments = list(search_text_segments(root))
 
         inline_segment = _get_first_inline_segment(segments)
@@ -68,7 +78,7 @@ class TestInlineSegmentIDAssignment(unittest.TestCase):
     def test_identical_elements_no_id(self):
         """测试相同属性的元素不分配 ID（全同粒子）"""
         # <p>X<em>A</em>Y<em>B</em>Z</p> - 两个 em 完全相同
-        root = fromstring("<p>X<em>A</em>Y<em>B</em>Z</p>")
+        root = _separated_ems_root()
         segments = list(search_text_segments(root))
 
         inline_segment = _get_first_inline_segment(segments)
@@ -162,7 +172,7 @@ class TestValidate(unittest.TestCase):
 
     def test_validate_correct_structure(self):
         """测试验证正确的结构"""
-        root = fromstring("<p>X<em>A</em>Y<em>B</em>Z</p>")
+        root = _separated_ems_root()
         segments = list(search_text_segments(root))
 
         inline_segment = _get_first_inline_segment(segments)
@@ -176,7 +186,7 @@ class TestValidate(unittest.TestCase):
 
     def test_validate_wrong_tag_count(self):
         """测试验证错误的标签数量"""
-        root = fromstring("<p>X<em>A</em>Y<em>B</em>Z</p>")
+        root = _separated_ems_root()
         segments = list(search_text_segments(root))
 
         inline_segment = _get_first_inline_segment(segments)
@@ -192,7 +202,7 @@ class TestValidate(unittest.TestCase):
 
     def test_validate_unexpected_id(self):
         """测试验证意外的 ID"""
-        root = fromstring("<p>X<em>A</em>Y<em>B</em>Z</p>")
+        root = _separated_ems_root()
         segments = list(search_text_segments(root))
 
         inline_segment = _get_first_inline_segment(segments)
@@ -233,7 +243,7 @@ class TestMatchChildren(unittest.TestCase):
 
     def test_match_by_natural_order(self):
         """测试通过自然顺序匹配（无 ID）"""
-        root = fromstring("<p>X<em>A</em>Y<em>B</em>Z</p>")
+        root = _separated_ems_root()
         segments = list(search_text_segments(root))
 
         inline_segment = _get_first_inline_segment(segments)
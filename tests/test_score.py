@@ -1,6 +1,6 @@
 import unittest
 from typing import cast
-from xml.etree.ElementTree import Element, SubElement
+from xml.etree.ElementTree import Element, SubElement, tostring
 
 from tiktoken import Encoding
 
@@ -50,16 +50,29 @@ class MockEncoding:
         return "".join(cast(list[str], tokens))
 
 
+# 多个用例用同一棵树构造 ScoreSegment，而 truncate_score_segment 不会改动入参（它克隆 text_segment），
+# 因此按序列化结果缓存，相同的树只做一次 segment 搜索与编码
+_score_segment_cache: dict[bytes, ScoreSegment] = {}
+
+
 # pylint: disable=W0212
 class TestTruncateScoreSegment(unittest.TestCase):
     """测试 truncate_score_segment 的截断逻辑"""
 
-    def setUp(self):
-        """初始化测试环境"""
-        self.encoding: Encoding = cast(Encoding, MockEncoding())
+    encoding: Encoding
+
+    @classmethod
+    def setUpClass(cls):
+        """MockEncoding 无状态，整个类共用一个实例即可"""
+        cls.encoding = cast(Encoding, MockEncoding())
 
     def _create_score_segment(self, root: Element) -> ScoreSegment:
         """从 Element 创建 ScoreSegment"""
+        cache_key = tostring(root)
+        cached_segment = _score_segment_cache.get(cache_key, None)
+        if cached_segment is not None:
+            return cached_segment
+
         text_segments = list(search_text_segments(root))
         inline_segments = list(search_inline_segments(text_segments))
         self.assertEqual(len(inline_segments), 1, "测试用例应该只有一个 inline segment")
@@ -67,6 +80,7 @@ class TestTruncateScoreSegment(unittest.TestCase):
 
         score_segments = list(expand_to_score_segments(self.encoding, inline_segment))
         self.assertEqual(len(score_segments), 1, "测试用例应该只有一个 score segment")
+        _score_segment_cache[cache_key] = score_segments[0]
         return score_segments[0]
 
     def test_truncate_head_chinese_text(self):
@@ -336,6 +350,33 @@ class TestTruncateScoreSegment(unittest.TestCase):
         assert result is not None
         self.assertEqual(result.text_segment.text, "ABC ...")
 
+    def test_truncate_budget_scan(self):
+        """测试一系列预算下的截断行为：segment 只构建一次，各预算共用"""
+        root = Element("div")
+        root.text = "这是一段用于预算扫描的中文文本"
+
+        score_segment = self._create_score_segment(root)
+        xml_overhead = score_segment.score - len(score_segment.text_tokens)
+
+        for remain_tokens in range(len(score_segment.text_tokens) + 1):
+            remain_score = xml_overhead + remain_tokens
+            for remain_head in (True, False):
+                with self.subTest(remain_tokens=remain_tokens, remain_head=remain_head):
+                    result = truncate_score_segment(
+                        encoding=self.encoding,
+                        score_segment=score_segment,
+                        remain_head=remain_head,
+                        remain_score=remain_score,
+                    )
+                    if remain_tokens == 0:
+                        # 预算只够 XML 开销时放弃整段
+                        self.assertIsNone(result)
+                    else:
+                        self.assertIsNotNone(result)
+                        assert result is not None
+                        self.assertLessEqual(result.score, remain_score)
+                        self.assertIn("...", result.text_segment.text)
+
     def test_mock_encoding_behavior(self):
         """测试 MockEncoding 的行为是否符合预期"""
         # 测试 XML 标签编码
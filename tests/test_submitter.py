@@ -3,7 +3,6 @@ from xml.etree.ElementTree import Element, fromstring, tostring
 
 from epub_translator.segment import search_text_segments
 from epub_translator.utils import normalize_whitespace
-from epub_translator.xml import iter_with_stack
 from epub_translator.xml_translator.stream_mapper import InlineSegmentMapping
 from epub_translator.xml_translator.submitter import SubmitKind, submit
 
@@ -22,12 +21,17 @@ def element_to_string(element: Element) -> str:
 
 def find_element_by_id(root: Element, element_id: str) -> Element:
     """通过 id 属性查找元素"""
-    for _, elem in iter_with_stack(root):
+    for elem in root.iter():
         if elem.get("id") == element_id:
             return elem
     raise ValueError(f"Cannot find element with id={element_id}")
 
 
+def index_elements_by_id(root: Element) -> dict[str, Element]:
+    """一次遍历建好 id 索引，同一棵树上的多次查找共用"""
+    return {elem_id: elem for elem in root.iter() if (elem_id := elem.get("id")) is not None}
+
+
 class TestSubmitReplace(unittest.TestCase):
     """测试 REPLACE 模式"""
 
@@ -128,8 +132,9 @@ class TestSubmitReplace(unittest.TestCase):
         </div>
         """
         root = parse_xml(xml_str)
-        d1 = find_element_by_id(root, "d1")
-        d2 = find_element_by_id(root, "d2")
+        id2element = index_elements_by_id(root)
+        d1 = id2element["d1"]
+        d2 = id2element["d2"]
 
         # 构造译文 - d1 的第一部分（hello world）
         trans1_xml = parse_xml("<span>你好世界</span>")
@@ -276,8 +281,9 @@ class TestSubmitEdgeCases(unittest.TestCase):
         </body>
         """
         root = parse_xml(xml_str)
-        desc = find_element_by_id(root, "desc")
-        p1 = find_element_by_id(root, "p1")
+        id2element = index_elements_by_id(root)
+        desc = id2element["desc"]
+        p1 = id2element["p1"]
 
         # 构造译文
         trans1_xml = parse_xml("<description>描述文本</description>")
@@ -339,8 +345,9 @@ class TestBugReproduction(unittest.TestCase):
         </p>
         """
         root = parse_xml(xml_str)
-        parent = find_element_by_id(root, "parent")
-        math = find_element_by_id(root, "math")
+        id2element = index_elements_by_id(root)
+        parent = id2element["parent"]
+        math = id2element["math"]
 
         # 创建 mappings 让 _nest_nodes 认为 math 应该是 parent 的 item
         # parent 先出现，然后 math 出现
@@ -384,9 +391,10 @@ class TestBugReproduction(unittest.TestCase):
         </body>
         """
         root = parse_xml(xml_str)
-        parent = find_element_by_id(root, "parent")
-        child1 = find_element_by_id(root, "child1")
-        child2 = find_element_by_id(root, "child2")
+        id2element = index_elements_by_id(root)
+        parent = id2element["parent"]
+        child1 = id2element["child1"]
+        child2 = id2element["child2"]
 
         # 模拟一个翻译场景：
         # - parent 的 "Text before." 被翻译
@@ -428,9 +436,10 @@ class TestBugReproduction(unittest.TestCase):
         </body>
         """
         root = parse_xml(xml_str)
-        parent = find_element_by_id(root, "parent")
-        child1 = find_element_by_id(root, "child1")
-        child2 = find_element_by_id(root, "child2")
+        id2element = index_elements_by_id(root)
+        parent = id2element["parent"]
+        child1 = id2element["child1"]
+        child2 = id2element["child2"]
 
         trans_before = list(search_text_segments(parse_xml("<span>之前</span>")))
         trans_child1 = list(search_text_segments(parse_xml("<p>块元素</p>")))
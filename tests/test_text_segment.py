@@ -1,8 +1,34 @@
+import copy
 import unittest
+from itertools import zip_longest
 from xml.etree.ElementTree import Element, SubElement, fromstring, tostring
 
 from epub_translator.segment.text_segment import combine_text_segments, search_text_segments
 
+# 模块级只构建一次深层嵌套模板，测试内用 C 层 deepcopy 取可变副本
+_DEEP_NESTING_DEPTH = 5
+_DEEP_NESTING_TEMPLATE = fromstring(
+    "<div>"
+    + "".join(f"<level{i}>Text{i}" for i in range(_DEEP_NESTING_DEPTH))
+    + "".join(f"</level{i}>" for i in reversed(range(_DEEP_NESTING_DEPTH)))
+    + "</div>"
+)
+
+
+def _trees_equal(tree1: Element, tree2: Element) -> bool:
+    """逐节点结构比较，首个差异即返回，不用序列化整棵树"""
+    for elem1, elem2 in zip_longest(tree1.iter(), tree2.iter()):
+        if elem1 is None or elem2 is None:
+            return False
+        if (
+            elem1.tag != elem2.tag
+            or elem1.attrib != elem2.attrib
+            or (elem1.text or "") != (elem2.text or "")
+            or (elem1.tail or "") != (elem2.tail or "")
+        ):
+            return False
+    return True
+
 
 class TestSearchTextSegments(unittest.TestCase):
     """测试 search_text_segments 文本片段提取功能"""
@@ -45,11 +71,7 @@ class TestSearchTextSegments(unittest.TestCase):
 
     def test_search_multiple_siblings(self):
         """测试提取兄弟元素"""
-        root = Element("div")
-        p1 = SubElement(root, "p")
-        p1.text = "Paragraph 1"
-        p2 = SubElement(root, "p")
-        p2.text = "Paragraph 2"
+        root = fromstring("<div><p>Paragraph 1</p><p>Paragraph 2</p></div>")
 
         segments = list(search_text_segments(root))
 
@@ -102,8 +124,8 @@ class TestCombineTextSegments(unittest.TestCase):
         root = Element("p")
         root.text = "Hello"
 
-        segments = list(search_text_segments(root))
-        rebuilt = list(e for e, _ in combine_text_segments(segments))
+        # segments 只被消费一次，直接串联两个生成器，不落中间列表
+        rebuilt = [e for e, _ in combine_text_segments(search_text_segments(root))]
 
         self.assertEqual(len(rebuilt), 1)
         self.assertEqual(rebuilt[0].tag, "p")
@@ -115,8 +137,7 @@ class TestCombineTextSegments(unittest.TestCase):
         em = SubElement(root, "em")
         em.text = "emphasized"
 
-        segments = list(search_text_segments(root))
-        rebuilt = list(e for e, _ in combine_text_segments(segments))
+        rebuilt = [e for e, _ in combine_text_segments(search_text_segments(root))]
 
         self.assertEqual(len(rebuilt), 1)
         self.assertEqual(rebuilt[0].tag, "p")
@@ -132,8 +153,7 @@ class TestCombineTextSegments(unittest.TestCase):
         root.set("id", "p1")
         root.text = "Content"
 
-        segments = list(search_text_segments(root))
-        rebuilt = list(e for e, _ in combine_text_segments(segments))
+        rebuilt = [e for e, _ in combine_text_segments(search_text_segments(root))]
 
         self.assertEqual(rebuilt[0].get("class"), "text")
         self.assertEqual(rebuilt[0].get("id"), "p1")
@@ -168,15 +188,11 @@ class TestSymmetry(unittest.TestCase):
     def _test_roundtrip(self, xml_str: str):
         """辅助方法：测试 XML 的往返转换"""
         original = fromstring(xml_str)
-        original_str = tostring(original, encoding="unicode")
 
-        segments = list(search_text_segments(original))
-        rebuilt = list(e for e, _ in combine_text_segments(segments))
+        rebuilt = [e for e, _ in combine_text_segments(search_text_segments(original))]
 
         self.assertEqual(len(rebuilt), 1)
-        rebuilt_str = tostring(rebuilt[0], encoding="unicode")
-
-        self.assertEqual(original_str, rebuilt_str)
+        self.assertTrue(_trees_equal(original, rebuilt[0]))
 
     def test_symmetry_simple_text(self):
         """测试对称性：纯文本"""
@@ -332,12 +348,7 @@ class TestEdgeCases(unittest.TestCase):
 
     def test_deep_nesting(self):
         """测试深层嵌套"""
-        root = Element("div")
-        current = root
-        for i in range(5):
-            child = SubElement(current, f"level{i}")
-            child.text = f"Text{i}"
-            current = child
+        root = copy.deepcopy(_DEEP_NESTING_TEMPLATE)
 
         segments = list(search_text_segments(root))
 
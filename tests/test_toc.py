@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from epub_translator.epub.toc import Toc, read_toc, write_toc
 from epub_translator.epub.zip import Zip
 from tests.utils import create_temp_dir_fixture
@@ -10,84 +12,95 @@ from tests.utils import create_temp_dir_fixture
 toc_temp_dir = create_temp_dir_fixture("toc")
 
 
-class TestReadTocEpub:
-    """测试 EPUB 2.0 格式的目录读取"""
+def _read_toc_once(source_path: Path, tmp_path_factory: pytest.TempPathFactory) -> list[Toc]:
+    temp_path = tmp_path_factory.mktemp("toc-read") / source_path.name
+    with Zip(source_path, temp_path) as zip_file:
+        toc_list, _context = read_toc(zip_file)
+    return toc_list
 
-    def test_read_little_prince_toc(self, toc_temp_dir):
-        """测试读取 The little prince.epub (EPUB 2.0) 的目录"""
-        source_path = Path("tests/assets/The little prince.epub")
-        temp_path = toc_temp_dir / "temp_little_prince.epub"
 
-        with Zip(source_path, temp_path) as zip_file:
-            toc_list, _context = read_toc(zip_file)
+# 只读测试共享 session 级 fixture：每本书只解包、重压缩一次，而不是每个测试一次
+@pytest.fixture(scope="session")
+def little_prince_toc(tmp_path_factory) -> list[Toc]:
+    return _read_toc_once(Path("tests/assets/The little prince.epub"), tmp_path_factory)
 
-            # 验证读取到的目录项数量
-            assert len(toc_list) == 28, "应该有 28 个顶层目录项"
-
-            # 验证第一个目录项
-            first_item = toc_list[0]
-            assert first_item.title == "Chapter I"
-            assert first_item.href == "7358.xhtml"
-            assert first_item.id == "0"
-            assert first_item.fragment is None
-            assert len(first_item.children) == 0
-
-            # 验证最后一个目录项（带锚点）
-            last_item = toc_list[-1]
-            assert last_item.title == "Saint-Exupéry: A Short Biography"
-            assert last_item.href == "10740.xhtml"
-            assert last_item.fragment == "10664"
-            assert last_item.full_href == "10740.xhtml#10664"
-            assert last_item.id == "27"
-
-    def test_read_chinese_book_toc(self, toc_temp_dir):
-        """测试读取治疗精神病.epub (EPUB 2.0) 的目录"""
-        source_path = Path("tests/assets/治疗精神病.epub")
-        temp_path = toc_temp_dir / "temp_chinese.epub"
 
-        with Zip(source_path, temp_path) as zip_file:
-            toc_list, _context = read_toc(zip_file)
+@pytest.fixture(scope="session")
+def chinese_book_toc(tmp_path_factory) -> list[Toc]:
+    return _read_toc_once(Path("tests/assets/治疗精神病.epub"), tmp_path_factory)
 
-            # 验证读取到的目录项数量
-            assert len(toc_list) == 1, "应该只有 1 个顶层目录项"
 
-            # 验证目录项
-            item = toc_list[0]
-            assert item.title == "封面"
-            assert item.href == "Text/cover.xhtml"
-            assert item.id == "cover"
-            assert len(item.children) == 0
+@pytest.fixture(scope="session")
+def deepseek_ocr_toc(tmp_path_factory) -> list[Toc]:
+    return _read_toc_once(Path("tests/assets/DeepSeek OCR.epub"), tmp_path_factory)
 
 
-class TestReadTocEpub3:
-    """测试 EPUB 3.0 格式的目录读取"""
+class TestReadTocEpub:
+    """测试 EPUB 2.0 格式的目录读取"""
 
-    def test_read_deepseek_ocr_toc(self, toc_temp_dir):
-        """测试读取 DeepSeek OCR.epub (EPUB 3.0) 的目录"""
-        source_path = Path("tests/assets/DeepSeek OCR.epub")
-        temp_path = toc_temp_dir / "temp_deepseek.epub"
+    def test_read_little_prince_toc(self, little_prince_toc):
+        """测试读取 The little prince.epub (EPUB 2.0) 的目录"""
+        toc_list = little_prince_toc
+
+        # 验证读取到的目录项数量
+        assert len(toc_list) == 28, "应该有 28 个顶层目录项"
+
+        # 验证第一个目录项
+        first_item = toc_list[0]
+        assert first_item.title == "Chapter I"
+        assert first_item.href == "7358.xhtml"
+        assert first_item.id == "0"
+        assert first_item.fragment is None
+        assert len(first_item.children) == 0
+
+        # 验证最后一个目录项（带锚点）
+        last_item = toc_list[-1]
+        assert last_item.title == "Saint-Exupéry: A Short Biography"
+        assert last_item.href == "10740.xhtml"
+        assert last_item.fragment == "10664"
+        assert last_item.full_href == "10740.xhtml#10664"
+        assert last_item.id == "27"
+
+    def test_read_chinese_book_toc(self, chinese_book_toc):
+        """测试读取治疗精神病.epub (EPUB 2.0) 的目录"""
+        toc_list = chinese_book_toc
 
-        with Zip(source_path, temp_path) as zip_file:
-            toc_list, _context = read_toc(zip_file)
+        # 验证读取到的目录项数量
+        assert len(toc_list) == 1, "应该只有 1 个顶层目录项"
 
-            # 验证读取到的目录项数量
-            assert len(toc_list) == 2, "应该有 2 个顶层目录项"
+        # 验证目录项
+        item = toc_list[0]
+        assert item.title == "封面"
+        assert item.href == "Text/cover.xhtml"
+        assert item.id == "cover"
+        assert len(item.children) == 0
 
-            # 验证第一个目录项
-            first_item = toc_list[0]
-            assert first_item.title == "封面"
-            assert first_item.href == "Text/cover.xhtml"
 
-            # 验证第二个目录项及其子节点
-            second_item = toc_list[1]
-            assert second_item.title == "DeepSeek-OCR: Contexts Optical Compression"
-            assert second_item.href == "Text/part01.xhtml"
-            assert len(second_item.children) > 0, "第二个目录项应该有子节点"
+class TestReadTocEpub3:
+    """测试 EPUB 3.0 格式的目录读取"""
 
-            # 验证子节点
-            first_child = second_item.children[0]
-            assert first_child.title == "Abstract"
-            assert first_child.href == "Text/part02.xhtml"
+    def test_read_deepseek_ocr_toc(self, deepseek_ocr_toc):
+        """测试读取 DeepSeek OCR.epub (EPUB 3.0) 的目录"""
+        toc_list = deepseek_ocr_toc
+
+        # 验证读取到的目录项数量
+        assert len(toc_list) == 2, "应该有 2 个顶层目录项"
+
+        # 验证第一个目录项
+        first_item = toc_list[0]
+        assert first_item.title == "封面"
+        assert first_item.href == "Text/cover.xhtml"
+
+        # 验证第二个目录项及其子节点
+        second_item = toc_list[1]
+        assert second_item.title == "DeepSeek-OCR: Contexts Optical Compression"
+        assert second_item.href == "Text/part01.xhtml"
+        assert len(second_item.children) > 0, "第二个目录项应该有子节点"
+
+        # 验证子节点
+        first_child = second_item.children[0]
+        assert first_child.title == "Abstract"
+        assert first_child.href == "Text/part02.xhtml"
 
 
 class TestWriteTocEpub:
@@ -1,46 +1,149 @@
 import io
+import re
 import unittest
 from typing import cast
 from xml.etree.ElementTree import Element
 
 from epub_translator.xml.xml_like import XMLLikeNode
 
-
-class TestXMLLikeNode(unittest.TestCase):
-    """测试 XMLLikeNode 类的功能"""
-
-    def test_preserve_encoding_utf8(self):
-        """测试保留 UTF-8 编码"""
-        original_content = b"""<?xml version="1.0" encoding="UTF-8"?>
+# 测试文档统一提升为模块常量：bytes 不可变，BytesIO 直接包装即可，无需在每个用例里重建字面量
+_UTF8_XHTML_DOC = b"""<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
 <html xmlns="http://www.w3.org/1999/xhtml">
 <head><title>Test</title></head>
 <body><p>Hello World</p></body>
 </html>"""
 
+_NAMESPACED_XHTML_DOC = b"""<?xml version="1.0"?>
+<html xmlns="http://www.w3.org/1999/xhtml">
+<body>
+<div xmlns:epub="http://www.idpf.org/2007/ops" epub:type="chapter">
+<p>Content with namespace</p>
+</div>
+</body>
+</html>"""
+
+_NO_DECLARATION_DOC = b"""<html>
+<head><title>Simple</title></head>
+<body><p>No declaration</p></body>
+</html>"""
+
+_OPF_DOC = b"""<?xml version="1.0" encoding="UTF-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="2.0">
+<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+<dc:title>Book Title</dc:title>
+<dc:creator>Author Name</dc:creator>
+</metadata>
+</package>"""
+
+_NCX_DOC = b"""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE ncx PUBLIC "-//NISO//DTD ncx 2005-1//EN" "http://www.daisy.org/z3986/2005/ncx-2005-1.dtd">
+<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
+<head>
+<meta name="dtb:uid" content="urn:uuid:12345"/>
+</head>
+<docTitle>
+<text>Table of Contents</text>
+</docTitle>
+</ncx>"""
+
+_COMPLEX_HEADER_DOC = b"""<?xml version="1.0" encoding="UTF-8"?>
+<?xml-stylesheet type="text/xsl" href="style.xsl"?>
+<!-- This is a comment -->
+<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN" "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">
+<!-- Another comment -->
+<?custom-instruction data="value"?>
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head><title>Complex Header</title></head>
+<body><p>Content</p></body>
+</html>"""
+
+# 一条 DOTALL 正则按出现顺序一次扫过所有 header 片段，替代逐条 assertIn 的反复全文扫描
+_COMPLEX_HEADER_PATTERN = re.compile(
+    rb'<\?xml version="1.0" encoding="UTF-8"\?>.*'
+    rb'<\?xml-stylesheet type="text/xsl" href="style.xsl"\?>.*'
+    rb"<!-- This is a comment -->.*"
+    rb"<!DOCTYPE html.*"
+    rb"<!-- Another comment -->.*"
+    rb'<\?custom-instruction data="value"\?>',
+    re.DOTALL,
+)
+
+_WHITESPACE_HEADER_DOC = b"""
+
+<?xml version="1.0" encoding="UTF-8"?>
+
+
+<!DOCTYPE html>
+
+
+<html>
+<head><title>Test</title></head>
+<body><p>Content</p></body>
+</html>"""
+
+_OPF_WITH_DC_PREFIX_DOC = b"""<?xml version="1.0" encoding="utf-8"?>
+<package version="3.0" unique-identifier="uid" xml:lang="en" xmlns="http://www.idpf.org/2007/opf" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <metadata>
+    <dc:identifier id="uid">test-book-id</dc:identifier>
+    <dc:language>en</dc:language>
+    <dc:title>Test Book Title</dc:title>
+    <dc:creator>Test Author</dc:creator>
+    <meta property="dcterms:modified">2025-12-31T00:00:00Z</meta>
+  </metadata>
+</package>"""
+
+_MATHML_DOC = b"""<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml" xmlns:m="http://www.w3.org/1998/Math/MathML">
+<head><title>Math Test</title></head>
+<body>
+  <p>Inline math: <m:math display="inline"><m:mrow><m:mi>x</m:mi><m:mo>=</m:mo><m:mn>1</m:mn></m:mrow></m:math></p>
+</body>
+</html>"""
+
+_UNQUOTED_ENTITIES_DOC = b"""<html>
+<body><p>A&nbsp;B &copy; &mdash; &lt;tag&gt; &#169; &#xA0;</p></body>
+</html>"""
+
+_APOSTROPHE_ENTITIES_DOC = b"""<html>
+<body><p>It's &copy;</p></body>
+</html>"""
+
+_QUOTED_ENTITY_ATTR_DOC = b"""<html>
+<body><p title="A&nbsp;B">Hello</p></body>
+</html>"""
+
+# UTF-16 文档无法写成 bytes 字面量，在模块加载时编码一次（含 BOM），用例只负责断言
+_UTF16_DOC = '<?xml version="1.0" encoding="UTF-16"?><root><item>测试</item></root>'.encode("utf-16")
+
+
+class TestXMLLikeNode(unittest.TestCase):
+    """测试 XMLLikeNode 类的功能"""
+
+    def test_preserve_encoding_utf8(self):
+        """测试保留 UTF-8 编码"""
         # 读取并修改
-        input_file = io.BytesIO(original_content)
+        input_file = io.BytesIO(_UTF8_XHTML_DOC)
         node = XMLLikeNode(input_file)
 
-        # 修改元素
-        cast(Element, node.element.find(".//p")).text = "Modified Text"
+        # 修改元素（iter 走 C 层遍历，不必编译 .//p 这样的迷你 XPath）
+        next(node.element.iter("p")).text = "Modified Text"
 
         # 保存
         output_file = io.BytesIO()
         node.save(output_file)
-        result = output_file.getvalue().decode("utf-8")
+        result = output_file.getvalue()
 
-        # 验证头部保留
-        self.assertIn('<?xml version="1.0" encoding="UTF-8"?>', result)
-        self.assertIn("<!DOCTYPE html>", result)
-        self.assertIn("Modified Text", result)
+        # 验证头部保留（断言都是 ASCII 子串，直接在 bytes 上查找即可，省一次整篇 decode）
+        self.assertIn(b'<?xml version="1.0" encoding="UTF-8"?>', result)
+        self.assertIn(b"<!DOCTYPE html>", result)
+        self.assertIn(b"Modified Text", result)
 
     def test_preserve_encoding_utf16(self):
         """测试保留 UTF-16 编码"""
-        original_content = '<?xml version="1.0" encoding="UTF-16"?><root><item>测试</item></root>'.encode("utf-16")
-
         # 读取
-        input_file = io.BytesIO(original_content)
+        input_file = io.BytesIO(_UTF16_DOC)
         node = XMLLikeNode(input_file)
 
         # 验证编码检测正确
@@ -48,43 +151,28 @@ class TestXMLLikeNode(unittest.TestCase):
 
     def test_clean_namespaces(self):
         """测试清理命名空间"""
-        original_content = b"""<?xml version="1.0"?>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<body>
-<div xmlns:epub="http://www.idpf.org/2007/ops" epub:type="chapter">
-<p>Content with namespace</p>
-</div>
-</body>
-</html>"""
-
         # 读取
-        input_file = io.BytesIO(original_content)
+        input_file = io.BytesIO(_NAMESPACED_XHTML_DOC)
         node = XMLLikeNode(input_file)
 
         # 验证命名空间被提取
         self.assertTrue(len(node.namespaces) > 0)
 
-        # 验证元素标签已清理（不再包含 {namespace}）
-        for elem in node.element.iter():
-            self.assertNotIn("{", elem.tag)
+        # 验证元素标签已清理（不再包含 {namespace}）：any 在首个违例处即停
+        self.assertFalse(any("{" in elem.tag for elem in node.element.iter()))
 
         # 保存
         output_file = io.BytesIO()
         node.save(output_file)
-        result = output_file.getvalue().decode("utf-8")
+        result = output_file.getvalue()
 
         # 验证命名空间声明在根元素
-        self.assertIn('xmlns="http://www.w3.org/1999/xhtml"', result)
+        self.assertIn(b'xmlns="http://www.w3.org/1999/xhtml"', result)
 
     def test_preserve_header_without_xml_declaration(self):
         """测试没有 XML 声明的情况"""
-        original_content = b"""<html>
-<head><title>Simple</title></head>
-<body><p>No declaration</p></body>
-</html>"""
-
         # 读取并保存
-        input_file = io.BytesIO(original_content)
+        input_file = io.BytesIO(_NO_DECLARATION_DOC)
         node = XMLLikeNode(input_file)
 
         output_file = io.BytesIO()
@@ -96,236 +184,156 @@ class TestXMLLikeNode(unittest.TestCase):
 
     def test_opf_file_with_multiple_namespaces(self):
         """测试 OPF 文件（多个命名空间）"""
-        original_content = b"""<?xml version="1.0" encoding="UTF-8"?>
-<package xmlns="http://www.idpf.org/2007/opf" version="2.0">
-<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
-<dc:title>Book Title</dc:title>
-<dc:creator>Author Name</dc:creator>
-</metadata>
-</package>"""
-
         # 读取
-        input_file = io.BytesIO(original_content)
+        input_file = io.BytesIO(_OPF_DOC)
         node = XMLLikeNode(input_file)
 
         # 修改内容
-        title_elem = node.element.find(".//title")
+        title_elem = next(node.element.iter("title"), None)
         if title_elem is not None:
             title_elem.text = "New Title"
 
         # 保存
         output_file = io.BytesIO()
         node.save(output_file)
-        result = output_file.getvalue().decode("utf-8")
+        result = output_file.getvalue()
 
         # 验证命名空间声明
-        self.assertIn("xmlns", result)
+        self.assertIn(b"xmlns", result)
         # 验证内容修改成功
         if title_elem is not None:
-            self.assertIn("New Title", result)
+            self.assertIn(b"New Title", result)
 
     def test_ncx_file(self):
         """测试 NCX 文件"""
-        original_content = b"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE ncx PUBLIC "-//NISO//DTD ncx 2005-1//EN" "http://www.daisy.org/z3986/2005/ncx-2005-1.dtd">
-<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
-<head>
-<meta name="dtb:uid" content="urn:uuid:12345"/>
-</head>
-<docTitle>
-<text>Table of Contents</text>
-</docTitle>
-</ncx>"""
-
         # 读取
-        input_file = io.BytesIO(original_content)
+        input_file = io.BytesIO(_NCX_DOC)
         node = XMLLikeNode(input_file)
 
         # 保存
         output_file = io.BytesIO()
         node.save(output_file)
-        result = output_file.getvalue().decode("utf-8")
+        result = output_file.getvalue()
 
         # 验证 DOCTYPE 保留
-        self.assertIn("<!DOCTYPE", result)
-        self.assertIn("Table of Contents", result)
+        self.assertIn(b"<!DOCTYPE", result)
+        self.assertIn(b"Table of Contents", result)
 
     def test_complex_header(self):
         """测试复杂的 header（多个处理指令、注释等）"""
-        original_content = b"""<?xml version="1.0" encoding="UTF-8"?>
-<?xml-stylesheet type="text/xsl" href="style.xsl"?>
-<!-- This is a comment -->
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN" "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">
-<!-- Another comment -->
-<?custom-instruction data="value"?>
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head><title>Complex Header</title></head>
-<body><p>Content</p></body>
-</html>"""
-
         # 读取
-        input_file = io.BytesIO(original_content)
+        input_file = io.BytesIO(_COMPLEX_HEADER_DOC)
         node = XMLLikeNode(input_file)
 
         # 保存
         output_file = io.BytesIO()
         node.save(output_file)
-        result = output_file.getvalue().decode("utf-8")
+        result = output_file.getvalue()
 
-        # 验证所有 header 内容都被保留
-        self.assertIn('<?xml version="1.0" encoding="UTF-8"?>', result)
-        self.assertIn('<?xml-stylesheet type="text/xsl" href="style.xsl"?>', result)
-        self.assertIn("<!-- This is a comment -->", result)
-        self.assertIn("<!DOCTYPE html", result)
-        self.assertIn("<!-- Another comment -->", result)
-        self.assertIn('<?custom-instruction data="value"?>', result)
-        self.assertIn("Complex Header", result)
+        # 验证所有 header 内容都被保留，且顺序不变
+        self.assertRegex(result, _COMPLEX_HEADER_PATTERN)
+        self.assertIn(b"Complex Header", result)
 
     def test_header_with_whitespace_and_newlines(self):
         """测试 header 中包含大量空白和换行的情况"""
-        original_content = b"""
-
-<?xml version="1.0" encoding="UTF-8"?>
-
-
-<!DOCTYPE html>
-
-
-<html>
-<head><title>Test</title></head>
-<body><p>Content</p></body>
-</html>"""
-
         # 读取
-        input_file = io.BytesIO(original_content)
+        input_file = io.BytesIO(_WHITESPACE_HEADER_DOC)
         node = XMLLikeNode(input_file)
 
         # 保存
         output_file = io.BytesIO()
         node.save(output_file)
-        result = output_file.getvalue().decode("utf-8")
+        result = output_file.getvalue()
 
         # 验证 header（包括所有空白）被保留
         # header 应该包含从开始到 <html 之前的所有内容
-        lines = result.split("<html>")
+        lines = result.split(b"<html>")
         header_part = lines[0]
-        self.assertIn("<?xml", header_part)
-        self.assertIn("<!DOCTYPE", header_part)
+        self.assertIn(b"<?xml", header_part)
+        self.assertIn(b"<!DOCTYPE", header_part)
         # 验证保留了空白行
-        self.assertTrue("\n\n" in header_part)
+        self.assertTrue(b"\n\n" in header_part)
 
     def test_namespace_prefix_restoration(self):
         """测试命名空间前缀恢复 - 修复 namespace prefix 丢失的核心问题"""
-        original_content = b"""<?xml version="1.0" encoding="utf-8"?>
-<package version="3.0" unique-identifier="uid" xml:lang="en" xmlns="http://www.idpf.org/2007/opf" xmlns:dc="http://purl.org/dc/elements/1.1/">
-  <metadata>
-    <dc:identifier id="uid">test-book-id</dc:identifier>
-    <dc:language>en</dc:language>
-    <dc:title>Test Book Title</dc:title>
-    <dc:creator>Test Author</dc:creator>
-    <meta property="dcterms:modified">2025-12-31T00:00:00Z</meta>
-  </metadata>
-</package>"""
-
         # 读取并解析
-        input_file = io.BytesIO(original_content)
+        input_file = io.BytesIO(_OPF_WITH_DC_PREFIX_DOC)
         node = XMLLikeNode(input_file)
 
         # 验证内部标签已被清理（不包含命名空间 URI）
-        for elem in node.element.iter():
-            self.assertNotIn("{", elem.tag, f"Tag should be cleaned: {elem.tag}")
+        dirty_tags = [elem.tag for elem in node.element.iter() if "{" in elem.tag]
+        self.assertFalse(dirty_tags, f"Tags should be cleaned: {dirty_tags}")
 
         # 保存
         output_file = io.BytesIO()
         node.save(output_file)
-        result = output_file.getvalue().decode("utf-8")
+        result = output_file.getvalue()
 
         # 核心验证：namespace prefix 必须恢复
-        self.assertIn('xmlns:dc="http://purl.org/dc/elements/1.1/"', result, "DC namespace declaration missing")
-        self.assertIn("<dc:identifier", result, "dc:identifier prefix missing")
-        self.assertIn("</dc:identifier>", result, "dc:identifier closing tag prefix missing")
-        self.assertIn("<dc:language>", result, "dc:language prefix missing")
-        self.assertIn("</dc:language>", result, "dc:language closing tag prefix missing")
-        self.assertIn("<dc:title>", result, "dc:title prefix missing")
-        self.assertIn("</dc:title>", result, "dc:title closing tag prefix missing")
-        self.assertIn("<dc:creator>", result, "dc:creator prefix missing")
-        self.assertIn("</dc:creator>", result, "dc:creator closing tag prefix missing")
+        self.assertIn(b'xmlns:dc="http://purl.org/dc/elements/1.1/"', result, "DC namespace declaration missing")
+        self.assertIn(b"<dc:identifier", result, "dc:identifier prefix missing")
+        self.assertIn(b"</dc:identifier>", result, "dc:identifier closing tag prefix missing")
+        self.assertIn(b"<dc:language>", result, "dc:language prefix missing")
+        self.assertIn(b"</dc:language>", result, "dc:language closing tag prefix missing")
+        self.assertIn(b"<dc:title>", result, "dc:title prefix missing")
+        self.assertIn(b"</dc:title>", result, "dc:title closing tag prefix missing")
+        self.assertIn(b"<dc:creator>", result, "dc:creator prefix missing")
+        self.assertIn(b"</dc:creator>", result, "dc:creator closing tag prefix missing")
 
         # 验证 xml:lang 属性（保留的 XML namespace）
-        self.assertIn('xml:lang="en"', result, "xml:lang attribute missing")
+        self.assertIn(b'xml:lang="en"', result, "xml:lang attribute missing")
 
         # 验证内容完整性
-        self.assertIn("test-book-id", result)
-        self.assertIn("Test Book Title", result)
-        self.assertIn("Test Author", result)
+        self.assertIn(b"test-book-id", result)
+        self.assertIn(b"Test Book Title", result)
+        self.assertIn(b"Test Author", result)
 
     def test_mathml_namespace_prefix_restoration(self):
         """测试 MathML 命名空间前缀恢复"""
-        original_content = b"""<?xml version="1.0" encoding="utf-8"?>
-<!DOCTYPE html>
-<html xmlns="http://www.w3.org/1999/xhtml" xmlns:m="http://www.w3.org/1998/Math/MathML">
-<head><title>Math Test</title></head>
-<body>
-  <p>Inline math: <m:math display="inline"><m:mrow><m:mi>x</m:mi><m:mo>=</m:mo><m:mn>1</m:mn></m:mrow></m:math></p>
-</body>
-</html>"""
-
         # 读取并解析
-        input_file = io.BytesIO(original_content)
+        input_file = io.BytesIO(_MATHML_DOC)
         node = XMLLikeNode(input_file)
 
         # 保存
         output_file = io.BytesIO()
         node.save(output_file)
-        result = output_file.getvalue().decode("utf-8")
+        result = output_file.getvalue()
 
         # 验证 MathML namespace 声明
-        self.assertIn('xmlns:m="http://www.w3.org/1998/Math/MathML"', result, "MathML namespace declaration missing")
+        self.assertIn(b'xmlns:m="http://www.w3.org/1998/Math/MathML"', result, "MathML namespace declaration missing")
 
         # 验证 MathML 元素的 prefix 恢复
-        self.assertIn("<m:math", result, "m:math prefix missing")
-        self.assertIn("</m:math>", result, "m:math closing tag prefix missing")
-        self.assertIn("<m:mrow>", result, "m:mrow prefix missing")
-        self.assertIn("</m:mrow>", result, "m:mrow closing tag prefix missing")
-        self.assertIn("<m:mi>", result, "m:mi prefix missing")
-        self.assertIn("<m:mo>", result, "m:mo prefix missing")
-        self.assertIn("<m:mn>", result, "m:mn prefix missing")
+        self.assertIn(b"<m:math", result, "m:math prefix missing")
+        self.assertIn(b"</m:math>", result, "m:math closing tag prefix missing")
+        self.assertIn(b"<m:mrow>", result, "m:mrow prefix missing")
+        self.assertIn(b"</m:mrow>", result, "m:mrow closing tag prefix missing")
+        self.assertIn(b"<m:mi>", result, "m:mi prefix missing")
+        self.assertIn(b"<m:mo>", result, "m:mo prefix missing")
+        self.assertIn(b"<m:mn>", result, "m:mn prefix missing")
 
     def test_unquoted_html_named_entities_are_supported(self):
         """测试引号外的 HTML 命名实体会被规范化为 XML 可解析内容"""
-        original_content = b"""<html>
-<body><p>A&nbsp;B &copy; &mdash; &lt;tag&gt; &#169; &#xA0;</p></body>
-</html>"""
-
-        input_file = io.BytesIO(original_content)
+        input_file = io.BytesIO(_UNQUOTED_ENTITIES_DOC)
         node = XMLLikeNode(input_file)
 
-        p = node.element.find(".//p")
+        p = next(node.element.iter("p"), None)
         self.assertIsNotNone(p)
         p = cast(Element, p)
         self.assertEqual(p.text, "A\u00a0B \u00a9 \u2014 <tag> \u00a9 \u00a0")
 
     def test_apostrophe_in_text_does_not_disable_html_entity_normalization(self):
         """测试正文中的 apostrophe 不会影响后续 HTML 命名实体规范化"""
-        original_content = b"""<html>
-<body><p>It's &copy;</p></body>
-</html>"""
-
-        input_file = io.BytesIO(original_content)
+        input_file = io.BytesIO(_APOSTROPHE_ENTITIES_DOC)
         node = XMLLikeNode(input_file)
 
-        p = node.element.find(".//p")
+        p = next(node.element.iter("p"), None)
         self.assertIsNotNone(p)
         p = cast(Element, p)
         self.assertEqual(p.text, "It's \u00a9")
 
     def test_quoted_html_named_entities_are_left_unchanged(self):
         """测试引号内的 HTML 命名实体不会被规范化"""
-        original_content = b"""<html>
-<body><p title="A&nbsp;B">Hello</p></body>
-</html>"""
-
-        input_file = io.BytesIO(original_content)
+        input_file = io.BytesIO(_QUOTED_ENTITY_ATTR_DOC)
         with self.assertRaises(ValueError):
             XMLLikeNode(input_file)
 
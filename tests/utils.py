@@ -1,17 +1,10 @@
-import shutil
-from pathlib import Path
-
 import pytest
 
 
 def create_temp_dir_fixture(subdir_name: str):
     @pytest.fixture
-    def temp_dir_fixture():
-        temp_path = Path("tests", "temp") / subdir_name
-        if temp_path.exists():
-            shutil.rmtree(temp_path)
-        temp_path.mkdir(parents=True, exist_ok=True)
-
-        yield temp_path
+    def temp_dir_fixture(tmp_path_factory: pytest.TempPathFactory):
+        # mktemp 生成带编号的独立目录，pytest-xdist 各 worker 并行跑也不会互相覆盖
+        yield tmp_path_factory.mktemp(subdir_name, numbered=True)
 
     return temp_dir_fixture